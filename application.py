@@ -14,10 +14,22 @@ Technologies Used:
 """
 
 # Import required libraries
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import (
+    Flask, render_template, request, redirect, url_for, flash, abort, Response,
+    stream_template, get_flashed_messages, make_response, g, has_request_context,
+)
+from flask_compress import Compress
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.http import is_resource_modified
+from sqlalchemy import event, inspect
+from datetime import date, datetime
+import csv
+import hashlib
+import io
+import itertools
 import os
+import re
 
 # ==============================================
 # APP CONFIGURATION
@@ -30,13 +42,146 @@ application = Flask(__name__)
 # Secret key for security (used for sessions and flash messages)
 application.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'leavetrack-secret-key')
 
+# Largest request body accepted (mainly CSV uploads to /bulk_add): 5 MB
+# Bigger requests are rejected with '413 Request Entity Too Large'
+application.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024
+
+# Cache static files (CSS, JS, images) in the browser for 1 year
+application.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+
+# Response compression - HTML pages are sent compressed (brotli or gzip)
+# Small responses and JSON (like /health) are sent as they are.
+# Streamed pages (the home page) are NOT compressed: Flask-Compress would have
+# to collect the whole page in memory first, which undoes the streaming.
+application.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+application.config['COMPRESS_MIN_SIZE'] = 500
+application.config['COMPRESS_MIMETYPES'] = ['text/html']
+application.config['COMPRESS_STREAMS'] = False
+Compress(application)
+
+# Template configuration
+# - Don't check template files for changes on every render (restart the app instead)
+# - Save compiled templates to disk so new workers don't have to compile them again
+#   (by default Jinja uses a private folder in the temp directory, owned by the
+#   user running the app; set JINJA_CACHE_DIR to choose another folder)
+application.config['TEMPLATES_AUTO_RELOAD'] = False
+JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR')
+if JINJA_CACHE_DIR:
+    os.makedirs(JINJA_CACHE_DIR, mode=0o700, exist_ok=True)
+application.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=JINJA_CACHE_DIR)
+application.jinja_env.auto_reload = False
+
+
+def preload_templates():
+    """
+    Loads every template into the app's one shared Jinja environment.
+    Requests then reuse the loaded templates instead of finding them on first use,
+    and gunicorn workers (started after this file is loaded) get them for free.
+    
+    This is only a speed-up: if a template can't be loaded now (for example the
+    bytecode cache folder is not writable), the app still starts and the
+    template is loaded on first use instead.
+    """
+    for name in application.jinja_env.list_templates():
+        try:
+            application.jinja_env.get_template(name)
+        except OSError as error:
+            application.logger.warning('Could not preload template %s: %s', name, error)
+
+
+preload_templates()
+
 # Database configuration - using SQLite (a simple file-based database)
-application.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///leaves.db'
+# The database file location is an absolute path, so it doesn't depend on the
+# folder the app is started from. Set DB_PATH to keep it on a persistent volume
+# (on Elastic Beanstalk: /var/app/data/leaves.db, see .ebextensions).
+DB_PATH = os.path.abspath(os.environ.get('DB_PATH', os.path.join(application.instance_path, 'leaves.db')))
+os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+application.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///file:{DB_PATH}?mode=rwc&uri=true'
 application.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Connection pool settings
+# - pool_size/max_overflow: keep connections open and reuse them between requests
+# - pool_pre_ping: check a connection is still alive before using it
+# - pool_recycle: replace connections older than 5 minutes
+# - check_same_thread: allow a pooled connection to be used by any worker thread
+# - timeout: wait up to 15 seconds for a database lock instead of failing straight away
+application.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_pre_ping': True,
+    'pool_recycle': 300,
+    'connect_args': {'check_same_thread': False, 'timeout': 15},
+}
+
+# Simple email format check: something@something.something (no spaces)
+EMAIL_REGEX = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Longest email address allowed by the email standard (RFC 5321)
+MAX_EMAIL_LENGTH = 254
+
+# Health check reply - it never changes, so build the JSON once
+HEALTH_RESPONSE_BODY = b'{"status":"healthy","app":"LeaveTrack-Pro"}'
+
+# Number of leave requests shown per page on the home page
+PER_PAGE = 50
+
+# Most leave requests that can be imported from one CSV file
+MAX_BULK_ROWS = 10000
+
 # Initialize database connection
 db = SQLAlchemy(application)
 
+# Development only: warn when one request runs too many SQL queries.
+# This usually means an N+1 problem (one extra query per row, e.g. a
+# relationship loaded inside a loop). When adding relationships to a model,
+# also use lazy='raise' so they must be loaded up front.
+# Set QUERY_LIMIT_RAISE=1 to turn the warning into an error (used in CI).
+MAX_QUERIES_PER_REQUEST = 10
+QUERY_LIMIT_RAISE = os.environ.get('QUERY_LIMIT_RAISE') == '1'
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Runs every time a new SQLite connection is opened.
+    
+    - journal_mode=WAL: readers no longer block writers (and vice versa)
+    - synchronous=NORMAL: safe with WAL and much faster than FULL
+    - temp_store=MEMORY: keep temporary tables/indexes in RAM
+    - mmap_size: memory-map up to 256 MB of the database file
+    - cache_size: use up to ~64 MB of page cache (negative value = KB)
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-64000')
+    cursor.close()
+
+
+def count_request_queries(conn, cursor, statement, parameters, context, executemany):
+    """
+    Runs before every SQL statement (debug mode only).
+    Counts the statements run by the current request and complains
+    when there are more than MAX_QUERIES_PER_REQUEST.
+    """
+    if not has_request_context():
+        return
+    g.query_count = g.get('query_count', 0) + 1
+    if g.query_count == MAX_QUERIES_PER_REQUEST + 1:
+        message = f'More than {MAX_QUERIES_PER_REQUEST} SQL queries in one request (possible N+1 problem)'
+        if QUERY_LIMIT_RAISE:
+            raise RuntimeError(message)
+        application.logger.warning(message)
+
+
+# Attach the handlers to the database engine
+with application.app_context():
+    event.listen(db.engine, 'connect', set_sqlite_pragmas)
+    if application.debug:
+        event.listen(db.engine, 'before_cursor_execute', count_request_queries)
+
 
 # ==============================================
 # DATABASE MODEL (Table Structure)
@@ -57,6 +202,7 @@ class LeaveRequest(db.Model):
     - reason: Why the employee needs leave
     - status: Pending, Approved, or Rejected
     - created_at: When this request was submitted
+    - updated_at: When this request was last changed (used for browser caching)
     """
     id = db.Column(db.Integer, primary_key=True)
     employee_name = db.Column(db.String(100), nullable=False)
@@ -67,11 +213,226 @@ class LeaveRequest(db.Model):
     reason = db.Column(db.Text, nullable=False)
     status = db.Column(db.String(20), default='Pending')  # Default status is Pending
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Indexes make the home page fast:
+    # - newest-first sorting reads the created_at index instead of sorting the whole table
+    # - filtering by status (Pending/Approved/Rejected) does not scan every row
+    __table_args__ = (
+        db.Index('ix_leave_created_at_desc', created_at.desc()),
+        db.Index('ix_leave_status', 'status'),
+    )
 
-# Create database tables when app starts
-with application.app_context():
+
+class DataVersion(db.Model):
+    """
+    A table with a single row that records when leave requests last changed.
+    Database triggers (created by db-init) update it on every insert, update
+    and delete, so the home page can check for changes with one quick lookup
+    instead of reading the whole leave_request table.
+    
+    Columns:
+    - id: Always 1 (there is only one row)
+    - version: Goes up by one on every change
+    - updated_at: When the last change happened
+    """
+    __tablename__ = 'data_version'
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+# SQL run by db-init: the data_version row, and triggers that update it
+# whenever a leave request is added, edited or deleted
+DATA_VERSION_SETUP = (
+    "INSERT OR IGNORE INTO data_version (id, version, updated_at) VALUES (1, 0, CURRENT_TIMESTAMP)",
+    """CREATE TRIGGER IF NOT EXISTS leave_request_insert_version AFTER INSERT ON leave_request
+    BEGIN
+        UPDATE data_version SET version = version + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS leave_request_update_version AFTER UPDATE ON leave_request
+    BEGIN
+        UPDATE data_version SET version = version + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS leave_request_delete_version AFTER DELETE ON leave_request
+    BEGIN
+        UPDATE data_version SET version = version + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+    END""",
+)
+
+
+# Create database tables - run once before starting the app:
+# flask --app application db-init
+# (not done on every start, so each gunicorn worker boots faster)
+@application.cli.command('db-init')
+def db_init():
+    """
+    Creates the database tables and indexes.
+    Safe to run again: anything that already exists is left alone.
+    """
     db.create_all()
+    # create_all() doesn't add new columns to an existing table, so add
+    # updated_at to databases created before it existed
+    columns = [column['name'] for column in inspect(db.engine).get_columns('leave_request')]
+    if 'updated_at' not in columns:
+        with db.engine.begin() as connection:
+            connection.execute(db.text('ALTER TABLE leave_request ADD COLUMN updated_at DATETIME'))
+            connection.execute(db.text('UPDATE leave_request SET updated_at = created_at'))
+    # create_all() skips tables that already exist, so add any
+    # missing indexes to databases created before they were defined
+    for index in LeaveRequest.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    # Set up the change tracking used by the home page (see DataVersion)
+    with db.engine.begin() as connection:
+        for statement in DATA_VERSION_SETUP:
+            connection.execute(db.text(statement))
+    print('Database ready!')
+
+
+# ==============================================
+# HELPER FUNCTIONS
+# ==============================================
+
+def validate_leave_form(form):
+    """
+    Checks the submitted leave form and converts it to Python values.
+    
+    The checks run from cheapest to most expensive and stop at the first
+    group that fails:
+    1. Required fields are filled in
+    2. Lengths and email format
+    3. Dates are real dates and in the right order
+    
+    Parameters:
+    - form: The submitted form data (request.form)
+    
+    Returns:
+    - fields: Dictionary of cleaned values (dates converted to date objects)
+    - errors: List of error messages (empty if everything is valid)
+    """
+    fields = {
+        'employee_name': form.get('employee_name', '').strip(),
+        'email': form.get('email', '').strip(),
+        'leave_type': form.get('leave_type', '').strip(),
+        'start_date': form.get('start_date', ''),
+        'end_date': form.get('end_date', ''),
+        'reason': form.get('reason', '').strip(),
+    }
+    errors = []
+
+    # Step 1: Check that everything is filled in
+    if not fields['employee_name']:
+        errors.append('Employee name must be at least 2 characters')
+    if not fields['email']:
+        errors.append('Please enter a valid email')
+    if not fields['leave_type']:
+        errors.append('Please select leave type')
+    if not fields['start_date'] or not fields['end_date']:
+        errors.append('Please select dates')
+    if not fields['reason']:
+        errors.append('Reason must be at least 10 characters')
+    if errors:
+        return fields, errors
+
+    # Step 2: Check lengths and email format
+    # Employee name must be at least 2 characters
+    if len(fields['employee_name']) < 2:
+        errors.append('Employee name must be at least 2 characters')
+    # Email must look like name@domain.com (length is checked first,
+    # so very long input never reaches the regex)
+    if len(fields['email']) > MAX_EMAIL_LENGTH or not EMAIL_REGEX.match(fields['email']):
+        errors.append('Please enter a valid email')
+    # Reason must be at least 10 characters
+    if len(fields['reason']) < 10:
+        errors.append('Reason must be at least 10 characters')
+    if errors:
+        return fields, errors
+
+    # Step 3: Convert date strings (YYYY-MM-DD from the date picker) to date objects
+    try:
+        fields['start_date'] = date.fromisoformat(fields['start_date'])
+        fields['end_date'] = date.fromisoformat(fields['end_date'])
+    except ValueError:
+        errors.append('Please enter valid dates')
+        return fields, errors
+
+    # End date must not be before start date
+    if fields['end_date'] < fields['start_date']:
+        errors.append('End date cannot be before start date')
+
+    return fields, errors
+
+
+def compute_build_info():
+    """
+    Works out which version of the code and templates is running.
+    
+    The page versions (ETags) used for browser caching include this, so
+    browsers fetch fresh pages after a deploy that changes the HTML, even
+    if no leave request has changed.
+    
+    Returns:
+    - token: Short hash of application.py and all template files
+    - modified: When the newest of those files was last changed (UTC)
+    """
+    template_dir = os.path.join(application.root_path, application.template_folder)
+    paths = [os.path.abspath(__file__)] + sorted(
+        os.path.join(template_dir, name) for name in application.jinja_env.list_templates()
+    )
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as source_file:
+            digest.update(source_file.read())
+    newest = max(os.path.getmtime(path) for path in paths)
+    return digest.hexdigest()[:12], datetime.utcfromtimestamp(int(newest))
+
+
+BUILD_TOKEN, BUILD_MODIFIED = compute_build_info()
+
+
+def not_modified_response(etag, last_modified):
+    """
+    Checks if the browser already has the latest version of a page.
+    
+    Browsers send back the ETag / Last-Modified values we gave them last time.
+    If nothing changed since then, we reply '304 Not Modified' with no body
+    and the browser shows its saved copy.
+    
+    Pages with pending flash messages are never treated as unchanged,
+    otherwise the message would not be shown.
+    
+    Returns:
+    - A 304 response if the browser's copy is still current
+    - None if the page needs to be sent
+    """
+    if get_flashed_messages():
+        return None
+
+    if request.if_none_match:
+        # Flask-Compress adds the compression type to the ETag of compressed
+        # pages ("abc" becomes "abc:gzip"), so accept those versions too
+        etags = [etag] + [f'{etag}:{algorithm}' for algorithm in application.config['COMPRESS_ALGORITHM']]
+        if not any(request.if_none_match.contains_weak(tag) for tag in etags):
+            return None
+    elif is_resource_modified(request.environ, last_modified=last_modified):
+        return None
+    return add_cache_headers(Response(status=304), etag, last_modified)
+
+
+def add_cache_headers(response, etag, last_modified):
+    """
+    Adds the ETag and Last-Modified headers used by not_modified_response().
+    
+    'Cache-Control: no-cache' makes the browser check with us every time
+    before reusing its copy, so changes are never missed.
+    """
+    if get_flashed_messages():
+        return response
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    return response
 
 
 # ==============================================
@@ -86,14 +447,62 @@ with application.app_context():
 def index():
     """
     This is the home page.
-    It fetches all leave requests from database and displays them.
+    It fetches leave requests from database and displays them, one page at a time.
     The requests are sorted by newest first (desc = descending order).
+    Only the columns shown in the table are loaded (the long 'reason' text is skipped).
+    The page is streamed: HTML is sent to the browser while rows are still being read.
+    
+    Query parameters:
+    - page: Which page to show, starting from 0 (e.g. /?page=1)
     """
-    # Get all leaves from database, newest first
-    leaves = LeaveRequest.query.order_by(LeaveRequest.created_at.desc()).all()
+    # Which page are we on? (never negative)
+    page = max(request.args.get('page', 0, type=int), 0)
+
+    # The page only changes when a leave is added, edited or deleted, or when
+    # the app itself changes. The data_version row tracks data changes (see
+    # DataVersion) and BUILD_TOKEN the code, so use both as the page version
+    # and skip the page completely if the browser already has this version.
+    # (updated_at keeps versions apart when a database is recreated and
+    # its counter starts again, or on another server with its own database)
+    version, updated_at = db.session.execute(
+        db.select(DataVersion.version, DataVersion.updated_at).where(DataVersion.id == 1)
+    ).one()
+    etag = f'{BUILD_TOKEN}-v{version}-{updated_at.isoformat()}'
+    last_modified = max(updated_at, BUILD_MODIFIED)
+    not_modified = not_modified_response(etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    # Get one page of leaves from database, newest first
+    # We ask for one extra row just to find out if there is a next page
+    # (the template hides that extra row and shows an "Older" link instead)
+    rows = db.session.execute(
+        db.select(
+            LeaveRequest.id,
+            LeaveRequest.employee_name,
+            LeaveRequest.leave_type,
+            LeaveRequest.start_date,
+            LeaveRequest.end_date,
+            LeaveRequest.status,
+            LeaveRequest.created_at,
+        )
+        .order_by(LeaveRequest.created_at.desc())
+        .limit(PER_PAGE + 1)
+        .offset(page * PER_PAGE)
+        .execution_options(yield_per=PER_PAGE)
+    )
+
+    # Read the flash messages now: the session cookie is sent before the
+    # streamed body, so removing them later (in the template) would not be saved
+    get_flashed_messages(with_categories=True)
+
+    # Peek at the first row so the template can tell if the page is empty
+    first = next(rows, None)
+    leaves = itertools.chain([first], rows) if first is not None else []
     
-    # Show the index.html page with the leave data
-    return render_template('index.html', leaves=leaves)
+    # Stream the index.html page with the leave data
+    response = make_response(stream_template('index.html', leaves=leaves, page=page, per_page=PER_PAGE))
+    return add_cache_headers(response, etag, last_modified)
 
 
 # ----------------------------------------------
@@ -111,68 +520,31 @@ def add_leave():
     
     # If form is submitted (POST request)
     if request.method == 'POST':
-        
-        # Get data from the form
-        employee_name = request.form.get('employee_name', '').strip()
-        email = request.form.get('email', '').strip()
-        leave_type = request.form.get('leave_type', '').strip()
-        start_date = request.form.get('start_date', '')
-        end_date = request.form.get('end_date', '')
-        reason = request.form.get('reason', '').strip()
 
         # ----------------------------------------------
         # INPUT VALIDATION - Check if data is valid
         # This is important for security!
         # ----------------------------------------------
-        errors = []
-        
-        # Check employee name (must be at least 2 characters)
-        if not employee_name or len(employee_name) < 2:
-            errors.append('Employee name must be at least 2 characters')
-        
-        # Check email (must contain @)
-        if not email or '@' not in email:
-            errors.append('Please enter a valid email')
-        
-        # Check leave type (must be selected)
-        if not leave_type:
-            errors.append('Please select leave type')
-        
-        # Check dates (must be provided)
-        if not start_date or not end_date:
-            errors.append('Please select dates')
-        
-        # Check reason (must be at least 10 characters)
-        if not reason or len(reason) < 10:
-            errors.append('Reason must be at least 10 characters')
+        fields, errors = validate_leave_form(request.form)
 
-        # If there are validation errors, show them and return to form
+        # If there are validation errors, show them (as one message)
+        # and return to the form with the values the user already typed
         if errors:
-            for error in errors:
-                flash(error, 'error')  # Show error message
-            return render_template('add_leave.html')
+            flash(' • '.join(errors), 'error')
+            return render_template('add_leave.html', form=request.form)
 
         # ----------------------------------------------
         # SAVE TO DATABASE
         # ----------------------------------------------
         try:
-            # Convert date strings to Python date objects
-            start = datetime.strptime(start_date, '%Y-%m-%d').date()
-            end = datetime.strptime(end_date, '%Y-%m-%d').date()
-            
-            # Check if end date is after start date
-            if end < start:
-                flash('End date cannot be before start date', 'error')
-                return render_template('add_leave.html')
-
             # Create new leave request object
             new_leave = LeaveRequest(
-                employee_name=employee_name,
-                email=email,
-                leave_type=leave_type,
-                start_date=start,
-                end_date=end,
-                reason=reason
+                employee_name=fields['employee_name'],
+                email=fields['email'],
+                leave_type=fields['leave_type'],
+                start_date=fields['start_date'],
+                end_date=fields['end_date'],
+                reason=fields['reason']
                 # status will be 'Pending' by default
             )
             
@@ -189,7 +561,8 @@ def add_leave():
             flash('Error submitting request', 'error')
 
     # If GET request, just show the empty form
-    return render_template('add_leave.html')
+    # (after a failed save, the form keeps the submitted values)
+    return render_template('add_leave.html', form=request.form)
 
 
 # ----------------------------------------------
@@ -205,10 +578,20 @@ def view_leave(id):
     - id: The unique ID of the leave request to view
     """
     # Find the leave request by ID (or show 404 error if not found)
-    leave = LeaveRequest.query.get_or_404(id)
+    leave = db.session.get(LeaveRequest, id) or abort(404)
+
+    # Skip the page if the browser already has the latest version
+    # (rows saved by an older version of the app may have no updated_at yet)
+    updated_at = leave.updated_at or leave.created_at
+    etag = f'{BUILD_TOKEN}-{leave.id}-{updated_at.isoformat()}'
+    last_modified = max(updated_at, BUILD_MODIFIED)
+    not_modified = not_modified_response(etag, last_modified)
+    if not_modified is not None:
+        return not_modified
     
     # Show the view page with leave details
-    return render_template('view_leave.html', leave=leave)
+    response = make_response(render_template('view_leave.html', leave=leave))
+    return add_cache_headers(response, etag, last_modified)
 
 
 # ----------------------------------------------
@@ -224,28 +607,48 @@ def edit_leave(id):
     Parameters:
     - id: The unique ID of the leave request to edit
     """
-    # Find the leave request by ID
-    leave = LeaveRequest.query.get_or_404(id)
-    
     # If form is submitted (POST request)
     if request.method == 'POST':
+        # Convert date strings (YYYY-MM-DD from the date picker) to Python date objects
+        try:
+            start = date.fromisoformat(request.form.get('start_date', ''))
+            end = date.fromisoformat(request.form.get('end_date', ''))
+        except ValueError:
+            # Check the leave request exists first, so a 404 doesn't leave
+            # the error message behind for the next page
+            leave = db.session.get(LeaveRequest, id) or abort(404)
+            flash('Please enter valid dates', 'error')
+            return render_template('edit_leave.html', leave=leave)
+
         # Update the leave request with new data
-        leave.employee_name = request.form.get('employee_name', '').strip()
-        leave.email = request.form.get('email', '').strip()
-        leave.leave_type = request.form.get('leave_type', '').strip()
-        leave.start_date = datetime.strptime(request.form.get('start_date'), '%Y-%m-%d').date()
-        leave.end_date = datetime.strptime(request.form.get('end_date'), '%Y-%m-%d').date()
-        leave.reason = request.form.get('reason', '').strip()
-        leave.status = request.form.get('status', 'Pending')  # Can change to Approved/Rejected
+        # (a single UPDATE statement - no need to load the row first)
+        rows = db.session.execute(
+            db.update(LeaveRequest)
+            .where(LeaveRequest.id == id)
+            .values(
+                employee_name=request.form.get('employee_name', '').strip(),
+                email=request.form.get('email', '').strip(),
+                leave_type=request.form.get('leave_type', '').strip(),
+                start_date=start,
+                end_date=end,
+                reason=request.form.get('reason', '').strip(),
+                status=request.form.get('status', 'Pending'),  # Can change to Approved/Rejected
+            )
+        ).rowcount
         
         # Save changes to database
         db.session.commit()
+
+        # No row was updated, so the leave request doesn't exist
+        if not rows:
+            abort(404)
         
         # Show success message and go to home page
         flash('Leave updated!', 'success')
         return redirect(url_for('index'))
     
     # If GET request, show the edit form with existing data
+    leave = db.session.get(LeaveRequest, id) or abort(404)
     return render_template('edit_leave.html', leave=leave)
 
 
@@ -262,18 +665,81 @@ def delete_leave(id):
     Parameters:
     - id: The unique ID of the leave request to delete
     """
-    # Find the leave request by ID
-    leave = LeaveRequest.query.get_or_404(id)
-    
-    # Delete from database
-    db.session.delete(leave)
+    # Delete from database with a single DELETE statement
+    # (no need to load the row first)
+    rows = db.session.execute(
+        db.delete(LeaveRequest).where(LeaveRequest.id == id)
+    ).rowcount
     db.session.commit()
+
+    # No row was deleted, so the leave request doesn't exist
+    if not rows:
+        abort(404)
     
     # Show success message and go to home page
     flash('Leave deleted!', 'success')
     return redirect(url_for('index'))
 
 
+# ----------------------------------------------
+# BULK ADD - Import many leave requests from a CSV file
+# URL: http://yourapp.com/bulk_add
+# Note: Only accepts POST requests with a file upload named 'file'
+# ----------------------------------------------
+@application.route('/bulk_add', methods=['POST'])
+def bulk_add():
+    """
+    Imports leave requests from an uploaded CSV file.
+    
+    The CSV must have a header row with these columns:
+    employee_name, email, leave_type, start_date, end_date, reason
+    
+    Files are limited to MAX_CONTENT_LENGTH bytes and MAX_BULK_ROWS rows.
+    
+    Every row is checked with the same rules as the Apply for Leave form.
+    If any row is invalid nothing is saved and the errors are returned.
+    Otherwise all rows are saved with one INSERT statement and one commit
+    (much faster than adding them one by one).
+    """
+    upload = request.files.get('file')
+    if upload is None:
+        return {'errors': ['Please upload a CSV file']}, 400
+
+    # Read and check every row before saving anything
+    try:
+        text = upload.stream.read().decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return {'errors': ['CSV file must be UTF-8 encoded']}, 400
+
+    rows = []
+    errors = []
+    # newline='' lets the csv module handle line breaks inside quoted fields
+    reader = csv.DictReader(io.StringIO(text, newline=''), restval='')
+    try:
+        # Row numbers start at 2 because row 1 is the header
+        for row_number, row in enumerate(reader, start=2):
+            if row_number - 1 > MAX_BULK_ROWS:
+                return {'errors': [f'CSV file can have at most {MAX_BULK_ROWS} leave requests']}, 400
+            fields, row_errors = validate_leave_form(row)
+            if row_errors:
+                errors.extend(f'Row {row_number}: {error}' for error in row_errors)
+            else:
+                rows.append(fields)
+    except csv.Error as error:
+        return {'errors': [f'Could not read CSV file: {error}']}, 400
+
+    if errors:
+        return {'errors': errors}, 400
+    if not rows:
+        return {'errors': ['CSV file has no leave requests']}, 400
+
+    # Save all rows at once (status, created_at and updated_at use their defaults)
+    db.session.execute(db.insert(LeaveRequest), rows)
+    db.session.commit()
+
+    return {'added': len(rows)}, 201
+
+
 # ----------------------------------------------
 # HEALTH CHECK - For monitoring the application
 # URL: http://yourapp.com/health
@@ -286,7 +752,9 @@ def health():
     Returns OK if the application is running.
     Used by AWS Elastic Beanstalk for monitoring.
     """
-    return {'status': 'healthy', 'app': 'LeaveTrack-Pro'}, 200
+    # A new Response each time (it can be changed by Flask after returning),
+    # but the JSON body is prepared in advance
+    return Response(HEALTH_RESPONSE_BODY, status=200, mimetype='application/json')
 
 
 # ==============================================
@@ -298,9 +766,17 @@ if __name__ == '__main__':
     This runs the application when you execute:
     python application.py
     
-    debug=True means:
-    - Shows detailed errors
-    - Auto-reloads when code changes
-    - Only use debug=True during development!
+    Debug mode is OFF unless you set FLASK_DEBUG=1:
+    - Shows detailed errors (and an interactive debugger!)
+    - Only listens on this computer (127.0.0.1), so nobody else can reach the debugger
+    - Only use debug mode during development!
+    
+    In production the app is run by gunicorn instead (see gunicorn.conf.py).
     """
-    application.run(debug=True)
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    application.run(
+        debug=debug,
+        host='127.0.0.1' if debug else '0.0.0.0',
+        use_reloader=False,
+        threaded=True,
+    )
@@ -0,0 +1,21 @@
+# ==============================================
+# LeaveTrack-Pro - Gunicorn Configuration
+# ==============================================
+#
+# Gunicorn reads this file automatically when it is started
+# from the project folder (Docker and Elastic Beanstalk both do this).
+#
+# ==============================================
+
+import multiprocessing
+
+# Number of worker processes - the usual rule is (2 x CPU cores) + 1
+workers = multiprocessing.cpu_count() * 2 + 1
+
+# Each worker uses threads, so slow requests don't block the whole worker
+worker_class = 'gthread'
+threads = 4
+
+# Load the application once before creating the workers
+# (workers share the loaded code and start faster)
+preload_app = True